@@ -7,10 +7,10 @@ SECONDS_PER_DAY = 24 * 60 * 60
 SECONDS_PER_HOUR = 3600
 # Constants
 MIN_URL_LENGTH = 3
-ALLOWED_SCHEMES = {"http", "https"}
+ALLOWED_SCHEMES = frozenset({"http", "https"})
 
 # Security related constants
-BLOCKED_DOMAINS = {
+BLOCKED_DOMAINS = frozenset({
     "localhost",
     "127.0.0.1",
     "0.0.0.0",
@@ -19,9 +19,11 @@ BLOCKED_DOMAINS = {
     "local",
     "intranet",
     "private",
-}
-BLOCKED_TLDS = {"local", "internal", "localhost", "invalid", "test"}
-SECURITY_PATTERNS = {
+})
+BLOCKED_TLDS = frozenset({"local", "internal", "localhost", "invalid", "test"})
+# Only iterated once at import (to build the alternation regex), so a
+# tuple is enough
+SECURITY_PATTERNS = (
     r"..//",  # Directory traversal
     "@",  # URL credentials
     "data:",  # Data URLs
@@ -33,4 +35,4 @@ SECURITY_PATTERNS = {
     "%00",  # Null byte
     "%0d",  # Carriage return
     "%0a",  # Line feed
-}
+)
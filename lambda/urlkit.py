@@ -3,13 +3,10 @@ import logging
 import os
 import string
 import time
-import uuid
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from typing import Any, Dict, Optional, TypedDict
 
 import boto3
-from boto3.dynamodb.conditions import Attr
 from botocore.exceptions import ClientError
 from constants import MAX_RETRIES, SECONDS_PER_DAY
 from utils import format_timestamp, normalize_expiry_days, validate_url
@@ -19,15 +16,29 @@ log_level = os.environ.get("LOG_LEVEL", "INFO")
 logger = logging.getLogger()
 logger.setLevel(log_level)
 
-# Initialize DynamoDB
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(os.environ["URL_TABLE"])
+# Initialize DynamoDB. The low-level client imports and initializes
+# faster than the resource abstraction and skips the per-call
+# TypeSerializer machinery; items are (de)serialized by hand below.
+dynamodb = boto3.client("dynamodb")
+TABLE_NAME = os.environ["URL_TABLE"]
 
 CHARSET = string.digits + string.ascii_letters
+_CHARSET_BYTES = CHARSET.encode("ascii")
+
+# Shared compact encoder for response bodies: skips the ASCII-escape
+# scan and the default separator whitespace
+_ENCODE_JSON = json.JSONEncoder(
+    ensure_ascii=False, separators=(",", ":"), check_circular=False
+).encode
 
 API_DOMAIN = os.environ.get('API_DOMAIN', 'api.urlkit.io')
 MAIN_DOMAIN = os.environ.get('MAIN_DOMAIN', 'urlkit.io')
 
+# Environment doesn't change across warm invocations, so resolve these
+# once at import instead of per request
+DOMAIN_PREFIX = os.environ.get("DOMAIN_PREFIX", "https://urlkit.io/")
+IS_DEVELOPMENT = os.environ.get("ENVIRONMENT") == "development"
+
 
 class URLCreationError(Exception):
     """Custom exception for URL creation errors"""
@@ -57,6 +68,34 @@ class URLResponse(TypedDict):
     request_id: str
 
 
+class _EntropyPool:
+    """
+    Process-wide buffer of random bytes served in small slices
+
+    Refills with a single os.urandom(4096) call, amortizing the
+    getrandom() syscall across ~512 short-ID generations. Lambda runs
+    one invocation at a time per container, so no locking is needed.
+    """
+
+    __slots__ = ("buf", "i")
+
+    def __init__(self):
+        self.buf = os.urandom(4096)
+        self.i = 0
+
+    def take(self, n):
+        """Return the next n random bytes, refilling the pool if needed"""
+        if self.i + n > len(self.buf):
+            self.buf = os.urandom(4096)
+            self.i = 0
+        start = self.i
+        self.i = start + n
+        return self.buf[start : self.i]
+
+
+_POOL = _EntropyPool()
+
+
 def generate_short_id(length=7):
     """
     Generate a random short ID of specified length
@@ -73,22 +112,35 @@ def generate_short_id(length=7):
     if length < 1:
         raise ValueError("Length must be positive")
 
-    # Use uuid4 for randomness
-    random_int = uuid.uuid4().int
+    # Draw 6 bits per base62 digit (2^6 = 64 > 62) so every digit is
+    # random at any requested length; the 8-byte floor keeps the
+    # default length=7 on a single cheap slice (64 bits > log2(62^7))
+    n = int.from_bytes(_POOL.take(max(8, (length * 6 + 7) // 8)), "big")
+
+    # Convert to base62, writing digits into a byte buffer so no
+    # intermediate one-character strings are created
+    out = bytearray(length)
+    for i in range(length):
+        n, remainder = divmod(n, 62)
+        out[i] = _CHARSET_BYTES[remainder]
 
-    # Convert to base62
-    short_id = ""
-    while random_int and len(short_id) < length:
-        short_id = CHARSET[random_int % 62] + short_id
-        random_int //= 62
+    return out.decode("ascii")
 
-    # Use single UUID for padding if needed
-    padding_uuid = uuid.uuid4().int
-    while len(short_id) < length:
-        short_id = CHARSET[padding_uuid % 62] + short_id
-        padding_uuid //= 62
 
-    return short_id
+def _to_dynamodb_item(item: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+    """Serialize a plain dict of strings and ints to DynamoDB JSON"""
+    return {
+        key: {"N": str(value)} if isinstance(value, int) else {"S": value}
+        for key, value in item.items()
+    }
+
+
+def _from_dynamodb_item(item: Dict[str, Dict[str, str]]) -> Dict[str, Any]:
+    """Deserialize a DynamoDB JSON item back to plain strings and ints"""
+    return {
+        key: int(value["N"]) if "N" in value else value["S"]
+        for key, value in item.items()
+    }
 
 
 def create_error_response(status_code: int, message: str, request_id: str) -> Dict[str, Any]:
@@ -100,7 +152,7 @@ def create_error_response(status_code: int, message: str, request_id: str) -> Di
             'Pragma': 'no-cache',
             'Expires': '0'
         },
-        'body': json.dumps({
+        'body': _ENCODE_JSON({
             'error': message,
             'request_id': request_id
         })
@@ -158,10 +210,8 @@ def create_success_response(
     expire_at: int,
 ) -> URLResponse:
     """Create standardized success response"""
-    domain_prefix = os.environ.get("DOMAIN_PREFIX", "https://urlkit.io/")
-
     return {
-        "short_url": f"{domain_prefix}{short_id}",
+        "short_url": f"{DOMAIN_PREFIX}{short_id}",
         "original_url": request.original_url,
         "expiration_date": format_timestamp(expire_at),
         "expires_in_days": request.expires_in_days,
@@ -223,16 +273,21 @@ def create_short_url(event: Dict[str, Any]) -> Dict[str, Any]:
             request_id=request_id,
         )
 
-        # TODO: Implement a more efficient collision resolution strategy
-        # Consider using a distributed counter or a pre-generated pool of unique IDs
-        for attempt in range(MAX_RETRIES):
+        # Candidate IDs are generated up front in one pass; BatchWriteItem
+        # cannot carry the attribute_not_exists condition, so the puts
+        # themselves stay sequential and almost always succeed first try
+        # (62^7 ~ 3.5e12 keyspace makes collisions astronomically rare)
+        candidate_ids = [generate_short_id() for _ in range(MAX_RETRIES)]
+
+        for attempt, short_id in enumerate(candidate_ids):
             try:
-                short_id = generate_short_id()
                 item = create_url_item(request, short_id)
 
                 # Ensure short_id doesn't exist
-                table.put_item(
-                    Item=item, ConditionExpression=Attr("short_url").not_exists()
+                dynamodb.put_item(
+                    TableName=TABLE_NAME,
+                    Item=_to_dynamodb_item(item),
+                    ConditionExpression="attribute_not_exists(short_url)",
                 )
 
                 # Create success response
@@ -254,7 +309,7 @@ def create_short_url(event: Dict[str, Any]) -> Dict[str, Any]:
 
                 return {
                     "statusCode": 200,
-                    "body": json.dumps(response_data),
+                    "body": _ENCODE_JSON(response_data),
                     "headers": {
                         "Content-Type": "application/json",
                         "Access-Control-Allow-Origin": "*",
@@ -310,11 +365,7 @@ def create_short_url(event: Dict[str, Any]) -> Dict[str, Any]:
             extra={"request_id": request_id, "error": str(e)},
             exc_info=True,
         )
-        error_message = (
-            str(e)
-            if os.environ.get("ENVIRONMENT") == "development"
-            else "Internal server error"
-        )
+        error_message = str(e) if IS_DEVELOPMENT else "Internal server error"
         return create_error_response(500, error_message, request_id)
 
 
@@ -349,26 +400,41 @@ def redirect_url(event: Dict[str, Any]) -> Dict[str, Any]:
             logger.warning("Missing short URL", extra={"request_id": request_id})
             return create_error_response(400, "Short URL is required", request_id)
 
-        # Query DynamoDB for the URL
-        response = table.query(
-            KeyConditionExpression="short_url = :short_id",
-            ExpressionAttributeValues={":short_id": short_id},
-            Limit=1,
-        )
+        current_time = int(time.time())
 
-        items = response.get("Items", [])
-        if not items:
-            logger.warning(
-                "URL not found", extra={"request_id": request_id, "short_id": short_id}
+        # short_url is the table's sole partition key, so one conditional
+        # UpdateItem validates existence and expiry, increments the click
+        # count and returns the item — no preceding query needed
+        try:
+            update_response = dynamodb.update_item(
+                TableName=TABLE_NAME,
+                Key={"short_url": {"S": short_id}},
+                UpdateExpression="SET clicks = clicks + :inc, last_accessed = :time",
+                ConditionExpression=(
+                    "attribute_exists(short_url) AND expire_at > :time"
+                ),
+                ExpressionAttributeValues={
+                    ":inc": {"N": "1"},
+                    ":time": {"N": str(current_time)},
+                },
+                ReturnValues="ALL_NEW",
+                ReturnValuesOnConditionCheckFailure="ALL_OLD",
             )
-            return create_error_response(404, "URL not found", request_id)
+            item = _from_dynamodb_item(update_response["Attributes"])
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
 
-        item = items[0]
-        current_time = int(datetime.now(timezone.utc).timestamp())
+            # ALL_OLD distinguishes a missing item from an expired one
+            old_item = e.response.get("Item")
+            if not old_item:
+                logger.warning(
+                    "URL not found",
+                    extra={"request_id": request_id, "short_id": short_id},
+                )
+                return create_error_response(404, "URL not found", request_id)
 
-        # Check expiration
-        expiration_time = item["expire_at"]
-        if expiration_time < current_time:
+            expiration_time = int(old_item["expire_at"]["N"])
             logger.info(
                 "URL has expired",
                 extra={
@@ -382,26 +448,12 @@ def redirect_url(event: Dict[str, Any]) -> Dict[str, Any]:
             )
             return create_error_response(410, "URL has expired", request_id)
 
-        # Update click count and last accessed time
-        try:
-            table.update_item(
-                Key={"short_url": short_id, "create_at": item["create_at"]},
-                UpdateExpression="SET clicks = clicks + :inc, last_accessed = :time",
-                ExpressionAttributeValues={":inc": 1, ":time": current_time},
-            )
-        except ClientError as e:
-            logger.error(
-                "Failed to update click count",
-                extra={"request_id": request_id, "short_id": short_id, "error": str(e)},
-            )
-            # Continue with redirect even if update fails
-
         logger.info(
             "Redirecting to original URL",
             extra={
                 "request_id": request_id,
                 "short_id": short_id,
-                "clicks": item.get("clicks", 0) + 1,
+                "clicks": item.get("clicks", 0),
             },
         )
 
@@ -493,9 +545,5 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             extra={"request_id": request_id, "error": str(e)},
             exc_info=True,
         )
-        error_message = (
-            str(e)
-            if os.environ.get("ENVIRONMENT") == "development"
-            else "Internal server error"
-        )
+        error_message = str(e) if IS_DEVELOPMENT else "Internal server error"
         return create_error_response(500, error_message, request_id)
\ No newline at end of file
@@ -1,8 +1,8 @@
 import ipaddress
 import logging
 import re
+import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from typing import Any, Optional, Tuple
 from urllib.parse import urlparse
 
@@ -21,6 +21,36 @@ from constants import (
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Bytes outside the printable ASCII range \x21-\x7E, used as a
+# translate() delete table to detect invalid characters in one C pass
+_BAD_BYTES = bytes(b for b in range(256) if b < 0x21 or b > 0x7E)
+
+# Single case-insensitive alternation so the suspicious-pattern scan is
+# one pass over the URL instead of one substring search per pattern
+_SECURITY_PATTERN_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in SECURITY_PATTERNS),
+    re.IGNORECASE,
+)
+
+# Same consolidation for blocked domains; the domain is lowercased
+# before matching so no IGNORECASE flag is needed
+_BLOCKED_DOMAIN_RE = re.compile(
+    "|".join(re.escape(blocked) for blocked in BLOCKED_DOMAINS)
+)
+
+# Shape of the overwhelmingly common case: scheme, simple host, optional
+# port, optional printable-ASCII path. One match proves the format rules
+# (scheme, netloc present, no credentials, printable ASCII only) in a
+# single pass, so the full parser only runs for unusual URLs. The group
+# captures the host for the security checks.
+# re.ASCII keeps IGNORECASE folding within ASCII; without it the
+# character classes also match Unicode case-folding look-alikes such
+# as U+212A (Kelvin sign) and U+017F (long s)
+_HAPPY_URL_RE = re.compile(
+    r"^https?://([A-Za-z0-9.\-]+)(?::\d+)?(?:/[\x21-\x7E]*)?$",
+    re.IGNORECASE | re.ASCII,
+)
+
 
 @dataclass(frozen=True)
 class ExpiryValidationResult:
@@ -83,14 +113,14 @@ def format_timestamp(timestamp: int, with_timezone: bool = True) -> str:
         >>> format_timestamp(1640995200, False)
         '2022-01-01T00:00:00.000000'
     """
-    dt = datetime.fromtimestamp(timestamp, timezone.utc)
-    formatted = dt.isoformat()
+    # Timestamps are whole UTC seconds, so strftime over gmtime covers
+    # the format without building a datetime object; the fractional
+    # part is always zero
+    formatted = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(timestamp))
+    formatted += ".000000"
 
-    if with_timezone and not formatted.endswith("Z"):
-        if formatted.endswith("+00:00"):
-            formatted = formatted[:-6] + "Z"
-        else:
-            formatted += "Z"
+    if with_timezone:
+        formatted += "Z"
 
     return formatted
 
@@ -118,11 +148,20 @@ def is_private_ip(ip_str: str) -> bool:
         return False
 
 
-def validate_url(url: str) -> Tuple[bool, Optional[str]]:
+def validate_url(
+    url: str,
+    _MIN_LEN: int = MIN_URL_LENGTH,
+    _MAX_LEN: int = MAX_URL_LENGTH,
+    _SCHEMES: frozenset = ALLOWED_SCHEMES,
+    _TLDS: frozenset = BLOCKED_TLDS,
+) -> Tuple[bool, Optional[str]]:
     """
     Validate URL format and security with comprehensive checks.
     Uses hybrid approach of returns and exceptions for different scenarios.
 
+    The underscored parameters are not part of the API; they bind the
+    module constants as locals so the hot path avoids global lookups.
+
     Args:
         url (str): URL to validate
 
@@ -137,15 +176,47 @@ def validate_url(url: str) -> Tuple[bool, Optional[str]]:
             return False, "URL must be a string"
 
         # Basic length validation
-        if not MIN_URL_LENGTH <= len(url) <= MAX_URL_LENGTH:
+        if not _MIN_LEN <= len(url) <= _MAX_LEN:
             return (
                 False,
-                f"URL length must be between {MIN_URL_LENGTH} and {MAX_URL_LENGTH} characters",
+                f"URL length must be between {_MIN_LEN} and {_MAX_LEN} characters",
             )
 
         # Normalize URL
         url = url.strip()
 
+        # Fast-path rejection: anything that doesn't start with an
+        # HTTP(S) scheme can be refused without running the full parser
+        if not url[:8].lower().startswith(("http://", "https://")):
+            return False, "URL must use HTTP or HTTPS protocol"
+
+        # Fast lane: a URL matching the happy-path shape has already
+        # proven every format rule, so only the security checks remain
+        happy = _HAPPY_URL_RE.match(url)
+        if happy:
+            domain = happy.group(1).lower()
+
+            if _BLOCKED_DOMAIN_RE.search(domain):
+                raise URLSecurityError("Domain not allowed")
+
+            tld = domain.split(".")[-1] if "." in domain else ""
+            if tld in _TLDS:
+                raise URLSecurityError("Invalid top-level domain")
+
+            if domain.count(".") == 3 and all(
+                part.isdigit() for part in domain.split(".")
+            ):
+                if is_private_ip(domain):
+                    raise URLSecurityError("Private IP addresses not allowed")
+
+            match = _SECURITY_PATTERN_RE.search(url)
+            if match:
+                raise URLSecurityError(
+                    f"URL contains suspicious pattern: {match.group(0)}"
+                )
+
+            return True, None
+
         # Parse URL - This might raise URLFormatError
         try:
             parsed = urlparse(url)
@@ -155,7 +226,7 @@ def validate_url(url: str) -> Tuple[bool, Optional[str]]:
         # Scheme validation
         if not parsed.scheme:
             return False, "URL must include scheme (http/https)"
-        if parsed.scheme.lower() not in ALLOWED_SCHEMES:
+        if parsed.scheme.lower() not in _SCHEMES:
             return False, "URL must use HTTP or HTTPS protocol"
 
         # Domain validation
@@ -170,16 +241,18 @@ def validate_url(url: str) -> Tuple[bool, Optional[str]]:
 
         # Security Checks - These raise URLSecurityError
         # 1. Check for blocked domains
-        if any(blocked in domain for blocked in BLOCKED_DOMAINS):
+        if _BLOCKED_DOMAIN_RE.search(domain):
             raise URLSecurityError("Domain not allowed")
 
         # 2. Check TLD
         tld = domain.split(".")[-1] if "." in domain else ""
-        if tld in BLOCKED_TLDS:
+        if tld in _TLDS:
             raise URLSecurityError("Invalid top-level domain")
 
         # 3. IP address validation
-        if re.match(r"^\d+\.\d+\.\d+\.\d+$", domain):
+        if domain.count(".") == 3 and all(
+            part.isdigit() for part in domain.split(".")
+        ):
             if is_private_ip(domain):
                 raise URLSecurityError("Private IP addresses not allowed")
 
@@ -188,12 +261,17 @@ def validate_url(url: str) -> Tuple[bool, Optional[str]]:
             raise URLSecurityError("URLs containing credentials are not allowed")
 
         # 5. Check for suspicious patterns
-        for pattern in SECURITY_PATTERNS:
-            if pattern in url.lower():
-                raise URLSecurityError(f"URL contains suspicious pattern: {pattern}")
+        match = _SECURITY_PATTERN_RE.search(url)
+        if match:
+            raise URLSecurityError(
+                f"URL contains suspicious pattern: {match.group(0)}"
+            )
 
         # 6. Validate characters (only printable ASCII)
-        if not re.match(r"^[\x21-\x7E]+$", url):
+        if not url.isascii():
+            raise URLSecurityError("URL contains invalid characters")
+        url_bytes = url.encode("ascii")
+        if url_bytes.translate(None, _BAD_BYTES) != url_bytes:
             raise URLSecurityError("URL contains invalid characters")
 
         return True, None
@@ -221,10 +299,17 @@ def validate_url(url: str) -> Tuple[bool, Optional[str]]:
         return False, "Invalid URL format"
 
 
-def validate_expiry_days(days: Any) -> Tuple[bool, Optional[str]]:
+def validate_expiry_days(
+    days: Any,
+    _MIN: int = MIN_EXPIRY_DAYS,
+    _MAX: int = MAX_EXPIRY_DAYS,
+) -> Tuple[bool, Optional[str]]:
     """
     Validate and normalize expiration days input.
 
+    The underscored parameters are not part of the API; they bind the
+    module constants as locals so the hot path avoids global lookups.
+
     Args:
         days: Raw input value for expiration days. Can be string, int, or float.
             Will be converted to int if possible.
@@ -250,28 +335,33 @@ def validate_expiry_days(days: Any) -> Tuple[bool, Optional[str]]:
             logger.info("Received None value for expiry days")
             return False, "Expiration days cannot be None"
 
-        # Convert to float first to handle both int and float inputs
-        try:
-            days_float = float(days)
-        except (ValueError, TypeError) as e:
-            logger.info(f"Invalid expiry days format: {days}", exc_info=True)
-            return False, "Invalid expiration days format"
-
-        # Convert to int and check for decimal values
-        days_int = int(days_float)
-        if days_float != days_int:
-            logger.info(f"Received decimal value for expiry days: {days}")
-            return False, "Expiration days must be a whole number"
+        # Fast path: JSON delivers whole numbers as int already, so skip
+        # the float round-trip (type check excludes bool, an int subclass)
+        if type(days) is int:
+            days_int = days
+        else:
+            # Convert to float first to handle both str and float inputs
+            try:
+                days_float = float(days)
+            except (ValueError, TypeError) as e:
+                logger.info(f"Invalid expiry days format: {days}", exc_info=True)
+                return False, "Invalid expiration days format"
+
+            # Convert to int and check for decimal values
+            days_int = int(days_float)
+            if days_float != days_int:
+                logger.info(f"Received decimal value for expiry days: {days}")
+                return False, "Expiration days must be a whole number"
 
         # Range validation
-        if not (MIN_EXPIRY_DAYS <= days_int <= MAX_EXPIRY_DAYS):
+        if not (_MIN <= days_int <= _MAX):
             logger.info(
                 f"Expiry days {days_int} outside allowed range "
-                f"({MIN_EXPIRY_DAYS}-{MAX_EXPIRY_DAYS})"
+                f"({_MIN}-{_MAX})"
             )
             return False, (
-                f"Expiration must be between {MIN_EXPIRY_DAYS} "
-                f"and {MAX_EXPIRY_DAYS} days"
+                f"Expiration must be between {_MIN} "
+                f"and {_MAX} days"
             )
 
         return True, None
@@ -299,7 +389,7 @@ def validate_expiry_days(days: Any) -> Tuple[bool, Optional[str]]:
         return False, f"Unexpected error: {str(e)}"
 
 
-def normalize_expiry_days(days: Any) -> int:
+def normalize_expiry_days(days: Any, _DEFAULT: int = DEFAULT_EXPIRY_DAYS) -> int:
     """
     Normalize and validate expiry days, returning default if invalid.
 
@@ -318,12 +408,12 @@ def normalize_expiry_days(days: Any) -> int:
     is_valid, error = validate_expiry_days(days)
     if not is_valid:
         logger.info(
-            f"Using default expiry days ({DEFAULT_EXPIRY_DAYS}) "
+            f"Using default expiry days ({_DEFAULT}) "
             f"due to validation error: {error}"
         )
-        return DEFAULT_EXPIRY_DAYS
+        return _DEFAULT
     try:
         return int(days)
     except ValueError:
         logger.info(f"Failed to convert {days} to int, using default value")
-        return DEFAULT_EXPIRY_DAYS
+        return _DEFAULT
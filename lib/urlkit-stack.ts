@@ -71,10 +71,12 @@ export class UrlkitStack extends cdk.Stack {
       logRetention: logs.RetentionDays.ONE_WEEK
     });
 
-    // DynamoDB Table
+    // DynamoDB Table. short_url is globally unique (enforced by the
+    // conditional insert), so it is the sole partition key and lookups
+    // can address items directly; create_at remains a plain attribute
+    // for the user-url-index.
     const urlTable = new ddb.Table(this, 'UrlTable', {
       partitionKey: { name: 'short_url', type: ddb.AttributeType.STRING },
-      sortKey: { name: 'create_at', type: ddb.AttributeType.NUMBER },
       billingMode: ddb.BillingMode.PAY_PER_REQUEST,
       timeToLiveAttribute: 'expire_at',
       removalPolicy: cdk.RemovalPolicy.DESTROY,